@@ -0,0 +1,85 @@
+// dynssz: Dynamic SSZ encoding/decoding for Ethereum with fastssz efficiency.
+// This file is part of the dynssz package.
+// Copyright (c) 2024 by pk910. Refer to LICENSE for more information.
+package dynssz_test
+
+import (
+	"bytes"
+	"reflect"
+	"sync"
+	"testing"
+
+	. "github.com/pk910/dynamic-ssz"
+)
+
+type slug_ConcurrentStruct struct {
+	F1 uint32
+	F2 []*slug_DynStruct1
+	F3 [][]uint16 `ssz-size:"?,2"`
+	F4 []slug_StaticStruct1
+}
+
+var concurrentPayload = slug_ConcurrentStruct{
+	F1: 42,
+	F2: []*slug_DynStruct1{
+		{F1: true, F2: []uint8{1, 2, 3}},
+		{F1: false, F2: []uint8{}},
+		{F1: true, F2: []uint8{4}},
+	},
+	F3: [][]uint16{{1, 2}, {3, 4}, {5, 6}},
+	F4: []slug_StaticStruct1{
+		{F1: true, F2: []uint8{1, 2, 3}},
+		{F1: false, F2: []uint8{4, 5, 6}},
+	},
+}
+
+func TestConcurrentMarshalUnmarshal(t *testing.T) {
+	// encode once on a separate instance to get the reference encoding
+	refSsz := NewDynSsz(nil)
+	refSsz.NoFastSsz = true
+	expected, err := refSsz.MarshalSSZ(concurrentPayload)
+	if err != nil {
+		t.Fatalf("reference marshal error: %v", err)
+	}
+
+	// all goroutines start on a fresh instance, so they race to fill the type caches
+	dynssz := NewDynSsz(nil)
+	dynssz.NoFastSsz = true
+
+	const goroutines = 16
+	const iterations = 20
+
+	var wg sync.WaitGroup
+	start := make(chan struct{})
+	for g := 0; g < goroutines; g++ {
+		wg.Add(1)
+		go func(g int) {
+			defer wg.Done()
+			<-start
+
+			for i := 0; i < iterations; i++ {
+				buf, err := dynssz.MarshalSSZ(concurrentPayload)
+				if err != nil {
+					t.Errorf("goroutine %v marshal error: %v", g, err)
+					return
+				}
+				if !bytes.Equal(buf, expected) {
+					t.Errorf("goroutine %v marshal failed: got 0x%x, wanted 0x%x", g, buf, expected)
+					return
+				}
+
+				obj := slug_ConcurrentStruct{}
+				if err := dynssz.UnmarshalSSZ(&obj, buf); err != nil {
+					t.Errorf("goroutine %v unmarshal error: %v", g, err)
+					return
+				}
+				if !reflect.DeepEqual(obj, concurrentPayload) {
+					t.Errorf("goroutine %v unmarshal failed: got %+v, wanted %+v", g, obj, concurrentPayload)
+					return
+				}
+			}
+		}(g)
+	}
+	close(start)
+	wg.Wait()
+}
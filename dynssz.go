@@ -9,13 +9,17 @@ package dynssz
 import (
 	"fmt"
 	"reflect"
+	"sync"
 )
 
+// DynSsz is the dynamic SSZ encoder/decoder. It caches type information across calls and is safe for concurrent use
+// by multiple goroutines, so a single instance can be shared for all encoding/decoding operations with the same specs.
 type DynSsz struct {
-	fastsszCompatCache map[reflect.Type]*fastsszCompatibility
-	typeSizeCache      map[reflect.Type]*cachedSszSize
+	fastsszCompatCache sync.Map // reflect.Type -> *fastsszCompatibility
+	typeSizeCache      sync.Map // reflect.Type -> *cachedSszSize
+	structFieldCache   sync.Map // reflect.Type -> []cachedSszField
 	specValues         map[string]any
-	specValueCache     map[string]*cachedSpecValue
+	specValueCache     sync.Map // string -> *cachedSpecValue
 	NoFastSsz          bool
 	Verbose            bool
 }
@@ -29,10 +33,7 @@ func NewDynSsz(specs map[string]any) *DynSsz {
 		specs = map[string]any{}
 	}
 	return &DynSsz{
-		fastsszCompatCache: map[reflect.Type]*fastsszCompatibility{},
-		typeSizeCache:      map[reflect.Type]*cachedSszSize{},
-		specValues:         specs,
-		specValueCache:     map[string]*cachedSpecValue{},
+		specValues: specs,
 	}
 }
 
@@ -45,7 +46,7 @@ func (d *DynSsz) MarshalSSZ(source any) ([]byte, error) {
 	sourceType := reflect.TypeOf(source)
 	sourceValue := reflect.ValueOf(source)
 
-	size, err := d.getSszValueSize(sourceType, sourceValue, []sszSizeHint{})
+	size, err := d.getSszRootValueSize(sourceType, sourceValue)
 	if err != nil {
 		return nil, err
 	}
@@ -88,13 +89,28 @@ func (d *DynSsz) SizeSSZ(source any) (int, error) {
 	sourceType := reflect.TypeOf(source)
 	sourceValue := reflect.ValueOf(source)
 
-	size, err := d.getSszValueSize(sourceType, sourceValue, []sszSizeHint{})
+	size, err := d.getSszRootValueSize(sourceType, sourceValue)
 	if err != nil {
 		return 0, err
 	}
 	return size, nil
 }
 
+// getSszRootValueSize calculates the SSZ size of a top-level value. The size of static size types does not depend on
+// the actual value, so it's taken from the type size directly. Nested values are sized by getSszValueSize, which only
+// walks into fields and items that are already known to be dynamic.
+func (d *DynSsz) getSszRootValueSize(sourceType reflect.Type, sourceValue reflect.Value) (int, error) {
+	typeSize, _, err := d.getSszSize(sourceType, []sszSizeHint{})
+	if err != nil {
+		return 0, err
+	}
+	if typeSize >= 0 {
+		return typeSize, nil
+	}
+
+	return d.getSszValueSize(sourceType, sourceValue, []sszSizeHint{})
+}
+
 // UnmarshalSSZ decodes the given SSZ-encoded data into the target object.
 // The 'ssz' byte slice contains the SSZ-encoded data, and 'target' is a pointer to the Go value that will hold the decoded data.
 // This method dynamically handles the decoding, accommodating for types with dynamic field sizes.
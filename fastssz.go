@@ -77,8 +77,8 @@ type fastsszCompatibility struct {
 //   that would prevent the use of fastssz for encoding or decoding.
 
 func (d *DynSsz) getFastsszCompatibility(targetType reflect.Type, sizeHints []sszSizeHint) (*fastsszCompatibility, error) {
-	if cachedCompatibility := d.fastsszCompatCache[targetType]; cachedCompatibility != nil {
-		return cachedCompatibility, nil
+	if cachedCompatibility, isCached := d.fastsszCompatCache.Load(targetType); isCached {
+		return cachedCompatibility.(*fastsszCompatibility), nil
 	}
 
 	_, hasSpecVals, err := d.getSszSize(targetType, sizeHints)
@@ -93,6 +93,6 @@ func (d *DynSsz) getFastsszCompatibility(targetType reflect.Type, sizeHints []ss
 		isHashRoot:           targetPtrType.Implements(sszHashRootType),
 		hasDynamicSpecValues: hasSpecVals,
 	}
-	d.fastsszCompatCache[targetType] = compatibility
+	d.fastsszCompatCache.Store(targetType, compatibility)
 	return compatibility, nil
 }
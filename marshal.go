@@ -149,13 +149,15 @@ func (d *DynSsz) marshalStruct(sourceType reflect.Type, sourceValue reflect.Valu
 	dynamicOffsets := []int{}
 	dynamicSizeHints := [][]sszSizeHint{}
 
-	for i := 0; i < sourceType.NumField(); i++ {
-		field := sourceType.Field(i)
+	fields, err := d.getSszStructFields(sourceType)
+	if err != nil {
+		return nil, err
+	}
 
-		fieldSize, _, sizeHints, err := d.getSszFieldSize(&field)
-		if err != nil {
-			return nil, err
-		}
+	for i := range fields {
+		field := &fields[i].field
+		fieldSize := fields[i].size
+		sizeHints := fields[i].sizeHints
 
 		if fieldSize > 0 {
 			//fmt.Printf("%sfield %d:\t static [%v:%v] %v\t %v\n", strings.Repeat(" ", idt+1), i, offset, offset+fieldSize, fieldSize, field.Name)
@@ -172,7 +174,7 @@ func (d *DynSsz) marshalStruct(sourceType reflect.Type, sourceValue reflect.Valu
 			buf = append(buf, 0, 0, 0, 0)
 			//fmt.Printf("%sfield %d:\t offset [%v:%v] %v\t %v\n", strings.Repeat(" ", idt+1), i, offset, offset+fieldSize, fieldSize, field.Name)
 
-			dynamicFields = append(dynamicFields, &field)
+			dynamicFields = append(dynamicFields, field)
 			dynamicOffsets = append(dynamicOffsets, offset)
 			dynamicSizeHints = append(dynamicSizeHints, sizeHints)
 		}
@@ -182,9 +184,7 @@ func (d *DynSsz) marshalStruct(sourceType reflect.Type, sourceValue reflect.Valu
 	for i, field := range dynamicFields {
 		// set field offset
 		fieldOffset := dynamicOffsets[i]
-		offsetBuf := make([]byte, 4)
-		binary.LittleEndian.PutUint32(offsetBuf, uint32(offset))
-		copy(buf[fieldOffset+startLen:fieldOffset+startLen+4], offsetBuf)
+		binary.LittleEndian.PutUint32(buf[fieldOffset+startLen:fieldOffset+startLen+4], uint32(offset))
 
 		//fmt.Printf("%sfield %d:\t dynamic [%v:]\t %v\n", strings.Repeat(" ", idt+1), field.Index[0], offset, field.Name)
 
@@ -239,16 +239,29 @@ func (d *DynSsz) marshalArray(sourceType reflect.Type, sourceValue reflect.Value
 		fieldType = fieldType.Elem()
 	}
 
+	bulkItemSize := 0
+	if !fieldIsPtr && fieldType != byteType {
+		size, err := d.getBulkItemSize(fieldType)
+		if err != nil {
+			return nil, err
+		}
+		bulkItemSize = size
+	}
+
 	arrLen := sourceType.Len()
 	if fieldType == byteType {
 		// shortcut for performance: use append on []byte arrays
-		if !sourceValue.CanAddr() {
-			// workaround for unaddressable static arrays
-			sourceValPtr := reflect.New(sourceType)
-			sourceValPtr.Elem().Set(sourceValue)
-			sourceValue = sourceValPtr.Elem()
+		if sourceValue.CanAddr() {
+			buf = append(buf, sourceValue.Bytes()...)
+		} else {
+			// unaddressable static arrays can't be sliced, copy them into the grown buffer instead
+			bufLen := len(buf)
+			buf = append(buf, make([]byte, arrLen)...)
+			reflect.Copy(reflect.ValueOf(buf[bufLen:]), sourceValue)
 		}
-		buf = append(buf, sourceValue.Bytes()...)
+	} else if bulkItemSize > 0 {
+		// shortcut for performance: encode bool, uint & byte array items in one go
+		buf = marshalBulkItems(buf, sourceValue, bulkItemSize)
 	} else {
 		for i := 0; i < arrLen; i++ {
 			itemVal := sourceValue.Index(i)
@@ -337,13 +350,28 @@ func (d *DynSsz) marshalSlice(sourceType reflect.Type, sourceValue reflect.Value
 		}
 	}
 
+	bulkItemSize := 0
+	if !fieldIsPtr && fieldType != byteType {
+		size, err := d.getBulkItemSize(fieldType)
+		if err != nil {
+			return nil, err
+		}
+		bulkItemSize = size
+	}
+
 	if fieldType == byteType {
 		// shortcut for performance: use append on []byte arrays
 		buf = append(buf, sourceValue.Bytes()...)
 
 		if appendZero > 0 {
-			zeroBytes := make([]uint8, appendZero)
-			buf = append(buf, zeroBytes...)
+			buf = append(buf, make([]byte, appendZero)...)
+		}
+	} else if bulkItemSize > 0 {
+		// shortcut for performance: encode bool, uint & byte array items in one go
+		buf = marshalBulkItems(buf, sourceValue, bulkItemSize)
+
+		if appendZero > 0 {
+			buf = append(buf, make([]byte, bulkItemSize*appendZero)...)
 		}
 	} else {
 
@@ -365,10 +393,8 @@ func (d *DynSsz) marshalSlice(sourceType reflect.Type, sourceValue reflect.Value
 		}
 
 		if appendZero > 0 {
-			zeroBuf := make([]byte, fieldSize)
-			for i := 0; i < appendZero; i++ {
-				buf = append(buf, zeroBuf...)
-			}
+			// static size items encode to all-zero bytes, so pad the whole range at once
+			buf = append(buf, make([]byte, fieldSize*appendZero)...)
 		}
 	}
 
@@ -419,9 +445,9 @@ func (d *DynSsz) marshalDynamicSlice(sourceType reflect.Type, sourceValue reflec
 		}
 	}
 
+	// reserve the offset table, offsets are filled in place while encoding the items
 	startOffset := len(buf)
-	offsetBuf := make([]byte, 4*(sliceLen+appendZero))
-	buf = append(buf, offsetBuf...)
+	buf = append(buf, make([]byte, 4*(sliceLen+appendZero))...)
 
 	fieldType := sourceType.Elem()
 	fieldIsPtr := fieldType.Kind() == reflect.Ptr
@@ -445,9 +471,7 @@ func (d *DynSsz) marshalDynamicSlice(sourceType reflect.Type, sourceValue reflec
 		newBufLen := len(newBuf)
 		buf = newBuf
 
-		offsetBuf := make([]byte, 4)
-		binary.LittleEndian.PutUint32(offsetBuf, uint32(offset))
-		copy(buf[startOffset+(i*4):startOffset+((i+1)*4)], offsetBuf)
+		binary.LittleEndian.PutUint32(buf[startOffset+(i*4):startOffset+((i+1)*4)], uint32(offset))
 
 		offset += newBufLen - bufLen
 		bufLen = newBufLen
@@ -465,9 +489,7 @@ func (d *DynSsz) marshalDynamicSlice(sourceType reflect.Type, sourceValue reflec
 		for i := 0; i < appendZero; i++ {
 			buf = append(buf, zeroBuf...)
 
-			offsetBuf := make([]byte, 4)
-			binary.LittleEndian.PutUint32(offsetBuf, uint32(offset))
-			copy(buf[startOffset+((sliceLen+i)*4):startOffset+(((sliceLen+i)+1)*4)], offsetBuf)
+			binary.LittleEndian.PutUint32(buf[startOffset+((sliceLen+i)*4):startOffset+(((sliceLen+i)+1)*4)], uint32(offset))
 
 			offset += zeroBufLen
 		}
@@ -35,6 +35,13 @@ var marshalTestMatrix = []struct {
 	{[]uint8{1, 2, 3, 4, 5}, fromHex("0x0102030405")},
 	{[5]uint8{1, 2, 3, 4, 5}, fromHex("0x0102030405")},
 	{[10]uint8{1, 2, 3, 4, 5}, fromHex("0x01020304050000000000")},
+	{[]uint16{1, 2, 1337}, fromHex("0x010002003905")},
+	{[3]uint32{1, 2, 817482215}, fromHex("0x0100000002000000e7c9b930")},
+	{[]uint64{1, 848028848028}, fromHex("0x01000000000000009c4f7572c5000000")},
+	{[]bool{true, false, false, true}, fromHex("0x01000001")},
+	{[3]bool{false, true, false}, fromHex("0x000100")},
+	{[][2]uint8{{1, 2}, {3, 4}}, fromHex("0x01020304")},
+	{[2][3]uint8{{1, 2, 3}, {4, 5, 6}}, fromHex("0x010203040506")},
 
 	// complex types
 	{
@@ -56,6 +63,20 @@ var marshalTestMatrix = []struct {
 		}{true, []uint8{1, 1, 1, 1}, []uint16{2, 2, 2, 2}, 3},
 		fromHex("0x0113000000020002000200020000000300000001010101"),
 	},
+	{
+		struct {
+			F1 [4]uint8
+			F2 uint8
+		}{[4]uint8{1, 2, 3, 4}, 5},
+		fromHex("0x0102030405"),
+	},
+	{
+		struct {
+			F1 []uint64 `ssz-size:"3"`
+			F2 [2]bool
+		}{[]uint64{1}, [2]bool{true, false}},
+		fromHex("0x0100000000000000000000000000000000000000000000000100"),
+	},
 	{
 		struct {
 			F1 uint8
@@ -107,3 +128,16 @@ func TestMarshal(t *testing.T) {
 		}
 	}
 }
+
+func TestMarshalFastsszItems(t *testing.T) {
+	// keep fastssz enabled, item types that implement fastssz must be encoded via their own methods
+	dynssz := NewDynSsz(nil)
+
+	buf, err := dynssz.MarshalSSZ(fastsszItemsPayload)
+	switch {
+	case err != nil:
+		t.Errorf("error: %v", err)
+	case !bytes.Equal(buf, fastsszItemsSsz):
+		t.Errorf("failed: got 0x%x, wanted 0x%x", buf, fastsszItemsSsz)
+	}
+}
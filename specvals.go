@@ -15,7 +15,8 @@ type cachedSpecValue struct {
 }
 
 func (d *DynSsz) getSpecValue(name string) (bool, uint64, error) {
-	if cachedValue := d.specValueCache[name]; cachedValue != nil {
+	if cachedEntry, isCached := d.specValueCache.Load(name); isCached {
+		cachedValue := cachedEntry.(*cachedSpecValue)
 		return cachedValue.resolved, cachedValue.value, nil
 	}
 
@@ -40,6 +41,6 @@ func (d *DynSsz) getSpecValue(name string) (bool, uint64, error) {
 
 	// fmt.Printf("spec lookup %v,  ok: %v, value: %v\n", name, cachedValue.resolved, cachedValue.value)
 
-	d.specValueCache[name] = cachedValue
+	d.specValueCache.Store(name, cachedValue)
 	return cachedValue.resolved, cachedValue.value, nil
 }
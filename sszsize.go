@@ -13,6 +13,13 @@ type cachedSszSize struct {
 	specval bool
 }
 
+type cachedSszField struct {
+	field     reflect.StructField
+	size      int
+	specval   bool
+	sizeHints []sszSizeHint
+}
+
 // getSszSize calculates the SSZ size of a given type, differentiating between static and dynamic sizes. It recursively
 // analyzes the target type to determine its static size or identifies it as dynamically sized if it is inherently dynamic
 // or contains dynamic elements at any level of its structure.
@@ -53,25 +60,27 @@ func (d *DynSsz) getSszSize(targetType reflect.Type, sizeHints []sszSizeHint) (i
 	}
 
 	// get size from cache if not influenced by a parent sizeHint
-	if cachedSize := d.typeSizeCache[targetType]; cachedSize != nil && len(sizeHints) == 0 {
-		return cachedSize.size, cachedSize.specval, nil
+	if len(sizeHints) == 0 {
+		if cachedEntry, isCached := d.typeSizeCache.Load(targetType); isCached {
+			cachedSize := cachedEntry.(*cachedSszSize)
+			return cachedSize.size, cachedSize.specval, nil
+		}
 	}
 
 	switch targetType.Kind() {
 	case reflect.Struct:
-		for i := 0; i < targetType.NumField(); i++ {
-			field := targetType.Field(i)
-			size, hasSpecVal, _, err := d.getSszFieldSize(&field)
-			if err != nil {
-				return 0, false, err
-			}
-			if size < 0 {
+		fields, err := d.getSszStructFields(targetType)
+		if err != nil {
+			return 0, false, err
+		}
+		for i := range fields {
+			if fields[i].size < 0 {
 				isDynamicSize = true
 			}
-			if hasSpecVal {
+			if fields[i].specval {
 				hasSpecValue = true
 			}
-			staticSize += size
+			staticSize += fields[i].size
 		}
 	case reflect.Array:
 		arrLen := targetType.Len()
@@ -124,12 +133,15 @@ func (d *DynSsz) getSszSize(targetType reflect.Type, sizeHints []sszSizeHint) (i
 
 	if isDynamicSize {
 		staticSize = -1
-	} else if len(sizeHints) == 0 {
-		// cache size if it's static and not influenced by a parent sizeHint
-		d.typeSizeCache[targetType] = &cachedSszSize{
+	}
+
+	if len(sizeHints) == 0 {
+		// cache size if it's not influenced by a parent sizeHint.
+		// dynamic types are cached too (as -1), so they are not re-evaluated for every walked value
+		d.typeSizeCache.Store(targetType, &cachedSszSize{
 			size:    staticSize,
 			specval: hasSpecValue,
-		}
+		})
 	}
 
 	return staticSize, hasSpecValue, nil
@@ -164,6 +176,44 @@ func (d *DynSsz) getSszFieldSize(targetField *reflect.StructField) (int, bool, [
 	return size, hasSpecVal, sszSizes, err
 }
 
+// getSszStructFields resolves the SSZ size information of all fields of a struct type. The field sizes and size hints
+// only depend on the struct type and the spec values of the DynSsz instance, so the results are cached per struct type
+// to avoid walking the field tags and types again for every encoded or decoded struct value.
+//
+// Parameters:
+// - structType: The reflect.Type of the struct whose fields are being analyzed.
+//
+// Returns:
+// - A slice of cachedSszField in field order, holding the field descriptor, its SSZ size (-1 for dynamically sized
+//   fields), whether it's influenced by a non-default spec value and the size hints derived from its tag annotations.
+// - An error if the size calculation for any of the fields fails.
+
+func (d *DynSsz) getSszStructFields(structType reflect.Type) ([]cachedSszField, error) {
+	if cachedFields, isCached := d.structFieldCache.Load(structType); isCached {
+		return cachedFields.([]cachedSszField), nil
+	}
+
+	fieldCount := structType.NumField()
+	fields := make([]cachedSszField, fieldCount)
+	for i := 0; i < fieldCount; i++ {
+		field := structType.Field(i)
+		size, hasSpecVal, sizeHints, err := d.getSszFieldSize(&field)
+		if err != nil {
+			return nil, err
+		}
+
+		fields[i] = cachedSszField{
+			field:     field,
+			size:      size,
+			specval:   hasSpecVal,
+			sizeHints: sizeHints,
+		}
+	}
+
+	d.structFieldCache.Store(structType, fields)
+	return fields, nil
+}
+
 // getSszValueSize calculates the absolute SSZ size of the specified targetValue, taking into account both simple and complex, nested types.
 // It enhances performance by employing the "SizeSSZ" function from fastssz for calculating the size of structures that, along with all types
 // they refer to, do not have dynamic specification values applied. This means that the size calculation defaults to the static, fastssz code path
@@ -222,17 +272,18 @@ func (d *DynSsz) getSszValueSize(targetType reflect.Type, targetValue reflect.Va
 
 		switch targetType.Kind() {
 		case reflect.Struct:
-			for i := 0; i < targetType.NumField(); i++ {
-				field := targetType.Field(i)
-				fieldValue := targetValue.Field(i)
+			fields, err := d.getSszStructFields(targetType)
+			if err != nil {
+				return 0, err
+			}
 
-				fieldTypeSize, _, fieldSizeHints, err := d.getSszFieldSize(&field)
-				if err != nil {
-					return 0, err
-				}
+			for i := range fields {
+				field := &fields[i]
+				fieldValue := targetValue.Field(i)
+				fieldTypeSize := field.size
 
 				if fieldTypeSize < 0 {
-					size, err := d.getSszValueSize(field.Type, fieldValue, fieldSizeHints)
+					size, err := d.getSszValueSize(field.field.Type, fieldValue, field.sizeHints)
 					if err != nil {
 						return 0, err
 					}
@@ -326,3 +377,47 @@ func (d *DynSsz) getSszValueSize(targetType reflect.Type, targetValue reflect.Va
 
 	return staticSize, nil
 }
+
+// getBulkItemSize returns the SSZ size of slice or array items that can be processed in bulk, without going through
+// marshalType / unmarshalType for each single item. This shortcut is limited to bool, unsigned integer and byte array
+// types (like roots or hashes) that are not handled by fastssz.
+//
+// Parameters:
+// - itemType: The reflect.Type of the slice or array items.
+//
+// Returns:
+// - The size of a single item if the items can be processed in bulk, or 0 if they need to be processed one by one.
+// - An error if the fastssz compatibility check for the item type fails.
+
+func (d *DynSsz) getBulkItemSize(itemType reflect.Type) (int, error) {
+	itemSize := 0
+	switch itemType.Kind() {
+	case reflect.Bool, reflect.Uint8:
+		itemSize = 1
+	case reflect.Uint16:
+		itemSize = 2
+	case reflect.Uint32:
+		itemSize = 4
+	case reflect.Uint64:
+		itemSize = 8
+	case reflect.Array:
+		if itemType.Elem() != byteType {
+			return 0, nil
+		}
+		itemSize = itemType.Len()
+	default:
+		return 0, nil
+	}
+
+	if !d.NoFastSsz {
+		fastsszCompat, err := d.getFastsszCompatibility(itemType, []sszSizeHint{})
+		if err != nil {
+			return 0, fmt.Errorf("failed checking fastssz compatibility: %v", err)
+		}
+		if fastsszCompat.isMarshaler || fastsszCompat.isUnmarshaler {
+			return 0, nil
+		}
+	}
+
+	return itemSize, nil
+}
@@ -83,14 +83,13 @@ func main() {
 }
 
 func print_test_result(title string, durationUnmarshal time.Duration, durationMarshal time.Duration, hash []byte, err error) {
-	fmt.Printf("%-18v", title)
-	fmt.Printf("  [%4v ms / %4v ms]\t ", durationUnmarshal.Milliseconds(), durationMarshal.Milliseconds())
+	status := "success"
 	if err != nil {
-		fmt.Printf("failed (%v)", err)
-	} else {
-		fmt.Printf("success")
+		status = fmt.Sprintf("failed (%v)", err)
 	}
-	fmt.Printf("\t Root: 0x%x\n", hash)
+
+	// format the whole result line first, so it's written to stdout with a single write
+	fmt.Printf("%-18v  [%4v ms / %4v ms]\t %v\t Root: 0x%x\n", title, durationUnmarshal.Milliseconds(), durationMarshal.Milliseconds(), status, hash)
 }
 
 func test_block_fastssz(in []byte, iterations int) (time.Duration, time.Duration, []byte, error) {
@@ -150,13 +150,15 @@ func (d *DynSsz) unmarshalStruct(targetType reflect.Type, targetValue reflect.Va
 	dynamicSizeHints := [][]sszSizeHint{}
 	sszSize := len(ssz)
 
-	for i := 0; i < targetType.NumField(); i++ {
-		field := targetType.Field(i)
+	fields, err := d.getSszStructFields(targetType)
+	if err != nil {
+		return 0, err
+	}
 
-		fieldSize, _, sizeHints, err := d.getSszFieldSize(&field)
-		if err != nil {
-			return 0, err
-		}
+	for i := range fields {
+		field := &fields[i].field
+		fieldSize := fields[i].size
+		sizeHints := fields[i].sizeHints
 
 		if fieldSize > 0 {
 			// static size field
@@ -188,7 +190,7 @@ func (d *DynSsz) unmarshalStruct(targetType reflect.Type, targetValue reflect.Va
 			// fmt.Printf("%sfield %d:\t offset [%v:%v] %v\t %v \t %v\n", strings.Repeat(" ", idt+1), i, offset, offset+fieldSize, fieldSize, field.Name, fieldOffset)
 
 			// store dynamic fields for later
-			dynamicFields = append(dynamicFields, &field)
+			dynamicFields = append(dynamicFields, field)
 			dynamicOffsets = append(dynamicOffsets, int(fieldOffset))
 			dynamicSizeHints = append(dynamicSizeHints, sizeHints)
 		}
@@ -271,11 +273,27 @@ func (d *DynSsz) unmarshalArray(targetType reflect.Type, targetValue reflect.Val
 		fieldType = fieldType.Elem()
 	}
 
+	bulkItemSize := 0
+	if !fieldIsPtr && fieldType != byteType {
+		size, err := d.getBulkItemSize(fieldType)
+		if err != nil {
+			return 0, err
+		}
+		bulkItemSize = size
+	}
+
 	arrLen := targetType.Len()
 	if fieldType == byteType {
 		// shortcut for performance: use copy on []byte arrays
 		reflect.Copy(targetValue, reflect.ValueOf(ssz[0:arrLen]))
 		consumedBytes = arrLen
+	} else if bulkItemSize > 0 {
+		// shortcut for performance: decode bool, uint & byte array items in one go
+		if itemSize := len(ssz) / arrLen; itemSize != bulkItemSize {
+			return 0, fmt.Errorf("unmarshalling array item did not consume expected ssz range (consumed: %v, expected: %v)", bulkItemSize, itemSize)
+		}
+		unmarshalBulkItems(targetValue, ssz)
+		consumedBytes = arrLen * bulkItemSize
 	} else {
 		offset := 0
 		itemSize := len(ssz) / arrLen
@@ -366,6 +384,14 @@ func (d *DynSsz) unmarshalSlice(targetType reflect.Type, targetValue reflect.Val
 		return d.unmarshalDynamicSlice(targetType, targetValue, ssz, childSizeHints, idt)
 	}
 
+	bulkItemSize := 0
+	if !fieldIsPtr && fieldType != byteType {
+		bulkItemSize, err = d.getBulkItemSize(fieldType)
+		if err != nil {
+			return 0, err
+		}
+	}
+
 	// slice with static size items
 	// fmt.Printf("new slice %v  %v\n", fieldType.Name(), sliceLen)
 	newValue := reflect.MakeSlice(targetType, sliceLen, sliceLen)
@@ -375,6 +401,10 @@ func (d *DynSsz) unmarshalSlice(targetType reflect.Type, targetValue reflect.Val
 		// shortcut for performance: use copy on []byte arrays
 		reflect.Copy(newValue, reflect.ValueOf(ssz[0:sliceLen]))
 		consumedBytes = sliceLen
+	} else if bulkItemSize > 0 {
+		// shortcut for performance: decode bool, uint & byte array items in one go
+		unmarshalBulkItems(newValue, ssz)
+		consumedBytes = sliceLen * bulkItemSize
 	} else {
 		offset := 0
 		if sliceLen > 0 {
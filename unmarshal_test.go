@@ -37,6 +37,13 @@ var unmarshalTestMatrix = []struct {
 	{[]uint8{1, 2, 3, 4, 5}, fromHex("0x0102030405")},
 	{[5]uint8{1, 2, 3, 4, 5}, fromHex("0x0102030405")},
 	{[10]uint8{1, 2, 3, 4, 5}, fromHex("0x01020304050000000000")},
+	{[]uint16{1, 2, 1337}, fromHex("0x010002003905")},
+	{[3]uint32{1, 2, 817482215}, fromHex("0x0100000002000000e7c9b930")},
+	{[]uint64{1, 848028848028}, fromHex("0x01000000000000009c4f7572c5000000")},
+	{[]bool{true, false, false, true}, fromHex("0x01000001")},
+	{[3]bool{false, true, false}, fromHex("0x000100")},
+	{[][2]uint8{{1, 2}, {3, 4}}, fromHex("0x01020304")},
+	{[2][3]uint8{{1, 2, 3}, {4, 5, 6}}, fromHex("0x010203040506")},
 
 	// complex types
 	{
@@ -83,6 +90,12 @@ var unmarshalTestMatrix = []struct {
 		}{42, []*slug_StaticStruct1{{false, []uint8{0, 0, 0}}, {true, []uint8{4, 8, 4}}, {false, []uint8{0, 0, 0}}}, 43},
 		fromHex("0x2a0000000001040804000000002b"),
 	},
+	{
+		struct {
+			F1 []*slug_DynStruct1
+		}{[]*slug_DynStruct1{{true, []uint8{4}}, {false, []uint8{}}}},
+		fromHex("0x04000000080000000e0000000105000000040005000000"),
+	},
 }
 
 func TestUnmarshal(t *testing.T) {
@@ -118,3 +131,17 @@ func TestUnmarshal(t *testing.T) {
 		}
 	}
 }
+
+func TestUnmarshalFastsszItems(t *testing.T) {
+	// keep fastssz enabled, item types that implement fastssz must be decoded via their own methods
+	dynssz := NewDynSsz(nil)
+
+	obj := &slug_FastsszItems{}
+	err := dynssz.UnmarshalSSZ(obj, fastsszItemsSsz)
+	switch {
+	case err != nil:
+		t.Errorf("error: %v", err)
+	case !reflect.DeepEqual(obj, fastsszItemsPayload):
+		t.Errorf("failed: got %v, wanted %v", obj, fastsszItemsPayload)
+	}
+}
@@ -3,6 +3,7 @@ package dynssz
 import (
 	"encoding/binary"
 	"fmt"
+	"reflect"
 	"time"
 )
 
@@ -51,30 +52,54 @@ func unmarshalTime(src []byte) time.Time {
 	return time.Unix(int64(unmarshallUint64(src)), 0).UTC()
 }
 
+// unmarshalBulkItems unmarshals a sequence of bools, little endian unsigned integers or byte arrays from the
+// src input into the items of the target slice or array
+func unmarshalBulkItems(target reflect.Value, src []byte) {
+	itemCount := target.Len()
+	switch target.Type().Elem().Kind() {
+	case reflect.Array:
+		itemSize := target.Type().Elem().Len()
+		for i := 0; i < itemCount; i++ {
+			reflect.Copy(target.Index(i), reflect.ValueOf(src[i*itemSize:(i+1)*itemSize]))
+		}
+	case reflect.Bool:
+		for i := 0; i < itemCount; i++ {
+			target.Index(i).SetBool(src[i] == 1)
+		}
+	case reflect.Uint8:
+		for i := 0; i < itemCount; i++ {
+			target.Index(i).SetUint(uint64(src[i]))
+		}
+	case reflect.Uint16:
+		for i := 0; i < itemCount; i++ {
+			target.Index(i).SetUint(uint64(binary.LittleEndian.Uint16(src[i*2:])))
+		}
+	case reflect.Uint32:
+		for i := 0; i < itemCount; i++ {
+			target.Index(i).SetUint(uint64(binary.LittleEndian.Uint32(src[i*4:])))
+		}
+	case reflect.Uint64:
+		for i := 0; i < itemCount; i++ {
+			target.Index(i).SetUint(binary.LittleEndian.Uint64(src[i*8:]))
+		}
+	}
+}
+
 // ---- Marshal functions ----
 
 // marshalUint64 marshals a little endian uint64 to dst
 func marshalUint64(dst []byte, i uint64) []byte {
-	buf := make([]byte, 8)
-	binary.LittleEndian.PutUint64(buf, i)
-	dst = append(dst, buf...)
-	return dst
+	return binary.LittleEndian.AppendUint64(dst, i)
 }
 
 // marshalUint32 marshals a little endian uint32 to dst
 func marshalUint32(dst []byte, i uint32) []byte {
-	buf := make([]byte, 4)
-	binary.LittleEndian.PutUint32(buf, i)
-	dst = append(dst, buf...)
-	return dst
+	return binary.LittleEndian.AppendUint32(dst, i)
 }
 
 // marshalUint16 marshals a little endian uint16 to dst
 func marshalUint16(dst []byte, i uint16) []byte {
-	buf := make([]byte, 2)
-	binary.LittleEndian.PutUint16(buf, i)
-	dst = append(dst, buf...)
-	return dst
+	return binary.LittleEndian.AppendUint16(dst, i)
 }
 
 // marshalUint8 marshals a little endian uint8 to dst
@@ -93,6 +118,43 @@ func marshalBool(dst []byte, b bool) []byte {
 	return dst
 }
 
+// marshalBulkItems marshals the bool, unsigned integer or byte array items of the source slice or array to dst
+func marshalBulkItems(dst []byte, source reflect.Value, itemSize int) []byte {
+	itemCount := source.Len()
+	offset := len(dst)
+	dst = append(dst, make([]byte, itemCount*itemSize)...)
+
+	switch source.Type().Elem().Kind() {
+	case reflect.Array:
+		for i := 0; i < itemCount; i++ {
+			reflect.Copy(reflect.ValueOf(dst[offset+i*itemSize:offset+(i+1)*itemSize]), source.Index(i))
+		}
+	case reflect.Bool:
+		for i := 0; i < itemCount; i++ {
+			if source.Index(i).Bool() {
+				dst[offset+i] = 1
+			}
+		}
+	case reflect.Uint8:
+		for i := 0; i < itemCount; i++ {
+			dst[offset+i] = uint8(source.Index(i).Uint())
+		}
+	case reflect.Uint16:
+		for i := 0; i < itemCount; i++ {
+			binary.LittleEndian.PutUint16(dst[offset+i*2:], uint16(source.Index(i).Uint()))
+		}
+	case reflect.Uint32:
+		for i := 0; i < itemCount; i++ {
+			binary.LittleEndian.PutUint32(dst[offset+i*4:], uint32(source.Index(i).Uint()))
+		}
+	case reflect.Uint64:
+		for i := 0; i < itemCount; i++ {
+			binary.LittleEndian.PutUint64(dst[offset+i*8:], source.Index(i).Uint())
+		}
+	}
+	return dst
+}
+
 // marshalTime marshals a time to dst
 func marshalTime(dst []byte, t time.Time) []byte {
 	return marshalUint64(dst, uint64(t.Unix()))
@@ -1,6 +1,11 @@
 package dynssz_test
 
-import "encoding/hex"
+import (
+	"encoding/binary"
+	"encoding/hex"
+
+	. "github.com/pk910/dynamic-ssz"
+)
 
 type slug_DynStruct1 struct {
 	F1 bool
@@ -12,6 +17,67 @@ type slug_StaticStruct1 struct {
 	F2 []uint8 `ssz-size:"3"`
 }
 
+// slug_FastsszUint64 is a uint64 with custom (big endian) fastssz methods.
+// it is used to check that item types implementing fastssz are not processed by the bulk shortcuts.
+type slug_FastsszUint64 uint64
+
+func (v *slug_FastsszUint64) MarshalSSZTo(dst []byte) ([]byte, error) {
+	return binary.BigEndian.AppendUint64(dst, uint64(*v)), nil
+}
+
+func (v *slug_FastsszUint64) MarshalSSZ() ([]byte, error) {
+	return v.MarshalSSZTo(nil)
+}
+
+func (v *slug_FastsszUint64) SizeSSZ() int {
+	return 8
+}
+
+func (v *slug_FastsszUint64) UnmarshalSSZ(buf []byte) error {
+	if len(buf) != 8 {
+		return ErrSize
+	}
+	*v = slug_FastsszUint64(binary.BigEndian.Uint64(buf))
+	return nil
+}
+
+// slug_FastsszBytes4 is a byte array with custom (reversed byte order) fastssz methods.
+// it is used to check that item types implementing fastssz are not processed by the bulk shortcuts.
+type slug_FastsszBytes4 [4]byte
+
+func (v *slug_FastsszBytes4) MarshalSSZTo(dst []byte) ([]byte, error) {
+	return append(dst, v[3], v[2], v[1], v[0]), nil
+}
+
+func (v *slug_FastsszBytes4) MarshalSSZ() ([]byte, error) {
+	return v.MarshalSSZTo(nil)
+}
+
+func (v *slug_FastsszBytes4) SizeSSZ() int {
+	return 4
+}
+
+func (v *slug_FastsszBytes4) UnmarshalSSZ(buf []byte) error {
+	if len(buf) != 4 {
+		return ErrSize
+	}
+	*v = slug_FastsszBytes4{buf[3], buf[2], buf[1], buf[0]}
+	return nil
+}
+
+type slug_FastsszItems struct {
+	F1 []slug_FastsszUint64
+	F2 [2]slug_FastsszBytes4
+}
+
+var fastsszItemsPayload = &slug_FastsszItems{
+	F1: []slug_FastsszUint64{1, 2},
+	F2: [2]slug_FastsszBytes4{{1, 2, 3, 4}, {5, 6, 7, 8}},
+}
+
+// custom big endian / reversed encoding, as produced by the fastssz methods of the item types
+var fastsszItemsSsz = fromHex("0x0c0000000403020108070605" + "0000000000000001" + "0000000000000002")
+
 // FromHex returns the bytes represented by the hexadecimal string s.
 // s may be prefixed with "0x".
 func fromHex(s string) []byte {